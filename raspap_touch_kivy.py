@@ -7,16 +7,28 @@ A Kivy-based touch panel UI for managing a RaspAP instance on a 3.5-inch
 """
 import os
 import json
+import asyncio
+import re
 import subprocess
 import logging
 import threading
 import time
 import shutil
+import socket
+import select
+import struct
+import fcntl
+import mmap
+import ctypes
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from functools import partial
+from functools import partial, lru_cache
 from contextlib import contextmanager
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ------------------------------------------------------------
 # Logging early, globals, HTTP session
@@ -26,34 +38,48 @@ logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s - %(levelname)s - %(mes
 log = logging.getLogger("RaspAPTouch")
 
 HTTP = requests.Session()
-HTTP.headers.update({"accept": "application/json"})
+HTTP.headers.update({"accept": "application/json", "Connection": "keep-alive"})
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=4, pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+)
+HTTP.mount("http://", _HTTP_ADAPTER)
+HTTP.mount("https://", _HTTP_ADAPTER)
+
+# Single worker for collect_snapshot (UiState.update_async keeps at most one in flight)
+STATE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="raspap-state")
+# Worker threads for the blocking status probes in collect_snapshot
+SNAPSHOT_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="raspap-snap")
 
 # ------------------------------------------------------------
-# Kivy imports (Config first)
+# Kivy imports (graphics config via KCFG_* env, read when kivy.config loads)
 # ------------------------------------------------------------
-from kivy.config import Config
-Config.set('graphics', 'fullscreen', '1')
-Config.set('graphics', 'width', '480')
-Config.set('graphics', 'height', '320')
+os.environ.setdefault('KCFG_GRAPHICS_FULLSCREEN', '1')
+os.environ.setdefault('KCFG_GRAPHICS_WIDTH', '480')
+os.environ.setdefault('KCFG_GRAPHICS_HEIGHT', '320')
+os.environ.setdefault('KCFG_GRAPHICS_BORDERLESS', '1')
+os.environ.setdefault('KCFG_GRAPHICS_MAXFPS', '30')
 
 from kivy.app import App
 from kivy.clock import Clock
 from kivy.core.window import Window
-from kivy.animation import Animation
-from kivy.core.text import LabelBase
+from kivy.core.text import LabelBase, Label as CoreLabel
+from kivy.metrics import dpi2px
 from kivy.uix.button import Button, ButtonBehavior
 from kivy.uix.label import Label
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
-from kivy.uix.screenmanager import ScreenManager, Screen, FadeTransition
+from kivy.uix.screenmanager import ScreenManager, Screen, FadeTransition, NoTransition
 from kivy.uix.popup import Popup
+from kivy.uix.modalview import ModalView
 from kivy.uix.scrollview import ScrollView
-from kivy.properties import StringProperty, NumericProperty, ListProperty
+from kivy.properties import StringProperty, NumericProperty, ListProperty, ObjectProperty
 from kivy.lang import Builder
 from kivy.utils import get_color_from_hex
 from kivy.uix.image import Image
 from kivy.event import EventDispatcher
 from kivy.uix.floatlayout import FloatLayout
+from kivy.graphics import Color, Rectangle, RoundedRectangle, PushMatrix, PopMatrix, Rotate
 
 # ------------------------------------------------------------
 # Config / constants
@@ -63,6 +89,11 @@ ASSETS_DIR = SCRIPT_DIR / "assets"
 OVPN_DIR = ASSETS_DIR / "ovpn"
 HOSTAPD_CONF = Path("/etc/hostapd/hostapd.conf")
 WPA_SUPPLICANT_CONF = Path("/etc/wpa_supplicant/wpa_supplicant.conf")
+SIOCGIFADDR = 0x8915
+THERMAL_ZONE = Path("/sys/class/thermal/thermal_zone0/temp")
+PROC_UPTIME = Path("/proc/uptime")
+WPA_CTRL_DIR = Path("/var/run/wpa_supplicant")
+GEOIP_CACHE_FILE = SCRIPT_DIR / ".geoip.cache.json"
 
 CONFIG = {}
 DEFAULT_CONFIG = {
@@ -71,6 +102,7 @@ DEFAULT_CONFIG = {
     "geoip_interval": 300,           # seconds; periodic GeoIP refresh
     "vpn_connect_timeout": 40,       # seconds; wait for tun/tap+IP when connecting
     "vpn_disconnect_timeout": 15,    # seconds; wait for teardown when disconnecting
+    "transitions": False,            # fade between screens (costly on a Pi)
     "theme": {
         "primary_color": "#3498DB", "accent_color": "#2ECC71",
         "background_color": "#ECF0F1", "text_light": "#FFFFFF",
@@ -90,6 +122,10 @@ except (FileNotFoundError, json.JSONDecodeError) as e:
     log.warning(f"Could not load or parse config.json: {e}. Using default values.")
     CONFIG = DEFAULT_CONFIG
 
+UPDATE_INTERVAL = CONFIG.get("update_interval", 2)   # seconds; state poll period
+GEOIP_INTERVAL = CONFIG.get("geoip_interval", 300)   # seconds; periodic GeoIP refresh
+GEOIP_CACHE_TTL = GEOIP_INTERVAL  # a net/VPN-triggered lookup stands in for the next periodic one
+
 Window.clearcolor = get_color_from_hex("#2C3E50")
 
 RASPAP_API_KEY = os.environ.get("RASPAP_API_KEY")
@@ -97,6 +133,8 @@ RASPAP_BASE_URL = os.environ.get("RASPAP_API_BASE_URL", "http://localhost:8081")
 
 # Font Awesome
 FA_FONT_FILE = str(ASSETS_DIR / "fontawesome.otf")
+_FA_LOCK = f"[font={FA_FONT_FILE}]\uf023[/font]"
+_FA_OPEN = f"[font={FA_FONT_FILE}]\uf09c[/font]"
 
 # --- FONT REGISTRATION ---
 try:
@@ -137,6 +175,7 @@ class ThemeManager:
         self.BUTTON_HEIGHT = 45
         self.PADDING = 10
         self.SPACING = 8
+        self.BUTTON_RADIUS = [self.PADDING / 2]
 
 THEME = ThemeManager(CONFIG)
 
@@ -166,6 +205,31 @@ def run_cmd(cmd, timeout=10, shell=False) -> str:
         return ""
 
 
+# Event loop thread for subprocess I/O; blocking probes use SNAPSHOT_POOL as its executor
+ASYNC_LOOP = asyncio.new_event_loop()
+ASYNC_LOOP.set_default_executor(SNAPSHOT_POOL)
+threading.Thread(target=ASYNC_LOOP.run_forever, name="raspap-async", daemon=True).start()
+
+async def run_cmd_async(cmd, timeout=10) -> str:
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+    except OSError as e:
+        log.debug("Could not start %s: %s", cmd, e)
+        return ""
+    try:
+        out, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        log.warning("Command timed-out: %s", cmd)
+        proc.kill()
+        await proc.wait()
+        return ""
+    if proc.returncode != 0:
+        return ""
+    return out.decode(errors="replace").strip()
+
+
 def raspap_api(endpoint: str, method: str = "GET", *, json_body=None, timeout=5):
     if not RASPAP_API_KEY:
         log.debug("RASPAP_API_KEY not set. Skipping API call.")
@@ -187,10 +251,14 @@ def raspap_api(endpoint: str, method: str = "GET", *, json_body=None, timeout=5)
 
 
 # ------------- Busy indicator (non-dimming overlay) -------------
-class BusyOverlay(FloatLayout):
-    def on_touch_down(self, touch): return True
-    def on_touch_move(self, touch): return True
-    def on_touch_up(self, touch): return True
+class BusyOverlay(ModalView):
+    """Fully transparent modal: ModalView already swallows all touches while open."""
+    def __init__(self, **kwargs):
+        kwargs.setdefault('auto_dismiss', False)
+        kwargs.setdefault('background', '')
+        kwargs.setdefault('background_color', (0, 0, 0, 0))
+        kwargs.setdefault('overlay_color', (0, 0, 0, 0))
+        super().__init__(**kwargs)
 
 BUSY_OVERLAY = None
 BUSY_DEPTH = 0
@@ -204,7 +272,6 @@ def show_busy_indicator():
     spinner = Image(source=str(ASSETS_DIR / 'loading.png'),
                     size_hint=(None, None), size=(120, 120),
                     pos_hint={'center_x': 0.5, 'center_y': 0.5})
-    from kivy.graphics import PushMatrix, PopMatrix, Rotate
     with spinner.canvas.before:
         PushMatrix()
         spinner.rot = Rotate(angle=0, axis=(0, 0, 1))
@@ -213,23 +280,22 @@ def show_busy_indicator():
     def update_origin(instance, value):
         instance.rot.origin = instance.center
     spinner.bind(center=update_origin)
-    anim = Animation(angle=-360, duration=1.0)
-    anim.repeat = True
-    anim.start(spinner.rot)
+    # One turn per second, redrawn at most 30 times a second
+    overlay._cb = Clock.schedule_interval(
+        lambda dt, r=spinner.rot: setattr(r, 'angle', (r.angle - 360 * dt) % 360), 1 / 30.)
     overlay.spinner = spinner
-    overlay.anim = anim
     overlay.add_widget(spinner)
     BUSY_OVERLAY = overlay
-    Window.add_widget(overlay)
+    overlay.open(animation=False)
 
 def hide_busy_indicator():
     global BUSY_OVERLAY, BUSY_DEPTH
     BUSY_DEPTH = max(0, BUSY_DEPTH - 1)
     if BUSY_OVERLAY and BUSY_DEPTH == 0:
         try:
-            if getattr(BUSY_OVERLAY, "spinner", None) and hasattr(BUSY_OVERLAY.spinner, "rot"):
-                Animation.cancel_all(BUSY_OVERLAY.spinner.rot)
-            Window.remove_widget(BUSY_OVERLAY)
+            if getattr(BUSY_OVERLAY, "_cb", None):
+                BUSY_OVERLAY._cb.cancel()
+            BUSY_OVERLAY.dismiss(animation=False)
         finally:
             BUSY_OVERLAY = None
 
@@ -244,53 +310,56 @@ def busy():
 
 # ------------- Toast message (non-dimming overlay) -------------
 TOAST_OVERLAY = None
+TOAST_DISMISS_EV = None
 
-def show_message(title, message, duration=2, is_error=False, position='center'):
-    global TOAST_OVERLAY
-    if TOAST_OVERLAY is not None:
-        try:
-            Window.remove_widget(TOAST_OVERLAY)
-        except Exception:
-            pass
-        TOAST_OVERLAY = None
+def _build_toast():
     overlay = FloatLayout(size_hint=(1, 1))
     container = BoxLayout(orientation='vertical', padding=THEME.PADDING, spacing=THEME.SPACING,
                           size_hint=(None, None))
-    container.size = (int(Window.width * 0.8), 110)
-    container.pos_hint = {'center_x': 0.5, 'center_y': 0.5} if position != 'bottom' else {'center_x': 0.5, 'y': 0.05}
-    title_color = THEME.BUTTON_BG_OFF if is_error else THEME.PRIMARY_COLOR
-    text_color = THEME.TEXT_COLOR_DARK
-    title_label = Label(text=title, halign='center', valign='middle',
-                        font_size=THEME.FONT_SIZE_HEADER, color=title_color, size_hint=(1, 0.5))
+    title_label = Label(halign='center', valign='middle',
+                        font_size=THEME.FONT_SIZE_HEADER, size_hint=(1, 0.5))
     title_label.bind(size=lambda w, _: setattr(w, 'text_size', w.size))
-    message_label = Label(text=message, halign='center', valign='middle',
-                          font_size=THEME.FONT_SIZE_NORMAL, color=text_color, size_hint=(1, 0.5))
+    message_label = Label(halign='center', valign='middle',
+                          font_size=THEME.FONT_SIZE_NORMAL, color=THEME.TEXT_COLOR_DARK, size_hint=(1, 0.5))
     message_label.bind(size=lambda w, _: setattr(w, 'text_size', w.size))
     container.add_widget(title_label); container.add_widget(message_label)
-    from kivy.graphics import Color, RoundedRectangle
     with container.canvas.before:
         Color(*THEME.BACKGROUND_COLOR)
         bg_rect = RoundedRectangle(pos=container.pos, size=container.size, radius=[6,])
     container.bind(pos=lambda i, _: setattr(bg_rect, 'pos', i.pos),
                    size=lambda i, _: setattr(bg_rect, 'size', i.size))
     overlay.add_widget(container)
-    TOAST_OVERLAY = overlay
-    Window.add_widget(overlay)
+    overlay.container = container
+    overlay.title_label = title_label
+    overlay.message_label = message_label
+    return overlay
+
+def show_message(title, message, duration=2, is_error=False, position='center'):
+    # One toast widget is built lazily and reused; each call just restyles it
+    global TOAST_OVERLAY, TOAST_DISMISS_EV
+    if TOAST_OVERLAY is None:
+        TOAST_OVERLAY = _build_toast()
+    overlay = TOAST_OVERLAY
+    if TOAST_DISMISS_EV is not None:
+        TOAST_DISMISS_EV.cancel()
+    overlay.container.size = (int(Window.width * 0.8), 110)
+    overlay.container.pos_hint = {'center_x': 0.5, 'center_y': 0.5} if position != 'bottom' else {'center_x': 0.5, 'y': 0.05}
+    overlay.title_label.text = title
+    overlay.title_label.color = THEME.BUTTON_BG_OFF if is_error else THEME.PRIMARY_COLOR
+    overlay.message_label.text = message
+    if overlay.parent is None:
+        Window.add_widget(overlay)
     def _dismiss(dt):
-        global TOAST_OVERLAY
-        try:
+        global TOAST_DISMISS_EV
+        TOAST_DISMISS_EV = None
+        if overlay.parent is not None:
             Window.remove_widget(overlay)
-        except Exception:
-            pass
-        if TOAST_OVERLAY is overlay:
-            TOAST_OVERLAY = None
-    Clock.schedule_once(_dismiss, duration)
+    TOAST_DISMISS_EV = Clock.schedule_once(_dismiss, duration)
 # ---------------------------------------------------------------
 
 # ------------- Paint screen black right now -------------
 def paint_black_now():
     try:
-        from kivy.graphics import Color, Rectangle
         from kivy.base import EventLoop
         Window.canvas.clear()
         with Window.canvas:
@@ -306,32 +375,142 @@ def paint_black_now():
         log.error(f"Could not paint black on exit: {e}")
 # ---------------------------------------------------------------
 
-def run_bg(fn, on_done=None):
-    def _worker():
-        result = None
-        err = None
-        try:
-            result = fn()
-        except Exception as e:
-            err = e
-            log.debug("Background task error: %s", e)
+BG_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="raspap-bg")
+
+def run_bg(fn, on_done=None, daemon=False):
+    """Run fn off the UI thread, then on_done(result, err) on it.
+
+    Short tasks share BG_POOL. Long blocking ones that cannot be cancelled
+    (Wi-Fi/VPN connects, scans, speed tests) pass daemon=True: pool workers
+    are joined at interpreter exit and would keep a closed app alive.
+    """
+    def _deliver(result, err):
+        if err:
+            log.debug("Background task error: %s", err)
         def _after(dt):
             if on_done:
                 on_done(result, err)
         Clock.schedule_once(_after, 0)
-    threading.Thread(target=_worker, daemon=True).start()
+    if daemon:
+        def _worker():
+            try:
+                result = fn()
+            except Exception as e:
+                _deliver(None, e)
+            else:
+                _deliver(result, None)
+        threading.Thread(target=_worker, daemon=True).start()
+        return
+    def _finished(fut):
+        if fut.cancelled():
+            return  # dropped by shutdown_workers()
+        err = fut.exception()
+        _deliver(None if err else fut.result(), err)
+    BG_POOL.submit(fn).add_done_callback(_finished)
+
+
+def shutdown_workers():
+    """Drop queued pool work at exit; running short tasks finish within their timeouts."""
+    for pool in (BG_POOL, STATE_POOL, SNAPSHOT_POOL):
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def read_cpu_temp():
+    try:
+        return int(THERMAL_ZONE.read_text().strip()) / 1000
+    except (OSError, ValueError):
+        return None
+
+
+def read_uptime() -> str:
+    """Same wording as `uptime -p` without the leading 'up '."""
+    try:
+        secs = int(float(PROC_UPTIME.read_text().split()[0]))
+    except (OSError, ValueError, IndexError):
+        return ""
+    parts = []
+    for unit, size in (("week", 604800), ("day", 86400), ("hour", 3600), ("minute", 60)):
+        n, secs = divmod(secs, size)
+        if n:
+            parts.append(f"{n} {unit}{'s' if n != 1 else ''}")
+    return ", ".join(parts) or "0 minutes"
+
+
+_HOSTAPD_UNIT = None
+_PYDBUS_MISSING = False  # set on the first failed import so later ticks go straight to systemctl
+
+def hostapd_active() -> bool:
+    """Query systemd over DBus when pydbus is available, else fall back to systemctl."""
+    global _HOSTAPD_UNIT, _PYDBUS_MISSING
+    if _PYDBUS_MISSING:
+        return run_cmd(["systemctl", "is-active", "hostapd"]) == "active"
+    try:
+        if _HOSTAPD_UNIT is None:
+            import pydbus
+            bus = pydbus.SystemBus()
+            path = bus.get('.systemd1').LoadUnit('hostapd.service')
+            _HOSTAPD_UNIT = bus.get('.systemd1', path)
+        return _HOSTAPD_UNIT.ActiveState == "active"
+    except ImportError:
+        log.info("pydbus not installed; checking hostapd via systemctl (apt install python3-pydbus)")
+        _PYDBUS_MISSING = True
+    except Exception as e:
+        log.debug("systemd DBus query failed: %s", e)
+        _HOSTAPD_UNIT = None
+    return run_cmd(["systemctl", "is-active", "hostapd"]) == "active"
+
+
+def is_process_running(name: str) -> bool:
+    """Scan /proc/*/comm ourselves instead of forking pgrep."""
+    for comm in Path('/proc').glob('[0-9]*/comm'):
+        try:
+            if comm.read_text().strip() == name:
+                return True
+        except OSError:
+            continue  # process exited mid-scan
+    return False
 
 
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+IN_CLOSE_WRITE, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x008, 0x080, 0x100, 0x200
+
+def inotify_watch(path: Path, mask: int):
+    """Non-blocking inotify fd watching `path`, or None where inotify is unavailable."""
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(fd, os.fsencode(str(path)), mask) < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, f"inotify_add_watch failed for {path}")
+        return fd
+    except (OSError, AttributeError) as e:
+        log.debug("inotify unavailable, falling back to mtime polling: %s", e)
+        return None
+
+def inotify_drain(fd: int) -> bool:
+    """Consume queued events; True if there were any."""
+    seen = False
+    while True:
+        try:
+            if not os.read(fd, 4096):
+                return seen
+            seen = True
+        except BlockingIOError:
+            return seen
+
+
+_HOSTAPD_RE = re.compile(rb'^[ \t]*(ssid|interface)=(.*?)[ \t\r]*$', re.M)
+
 def parse_hostapd_conf():
     ssid = iface = None
     try:
-        with HOSTAPD_CONF.open("r") as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith("ssid="):
-                    ssid = line.split("=", 1)[1]
-                elif line.startswith("interface="):
-                    iface = line.split("=", 1)[1]
+        d = dict(_HOSTAPD_RE.findall(HOSTAPD_CONF.read_bytes()))
+        ssid = d[b'ssid'].decode(errors="replace") if b'ssid' in d else None
+        iface = d[b'interface'].decode(errors="replace") if b'interface' in d else None
     except Exception as e:
         log.debug("hostapd.conf parse error: %s", e)
     return ssid, iface
@@ -340,15 +519,55 @@ def parse_hostapd_conf():
 # ------------------------------------------------------------
 # Wi-Fi utils (saved networks + scan + connect)
 # ------------------------------------------------------------
+@lru_cache(maxsize=None)
 def has_cmd(name: str) -> bool:
     return shutil.which(name) is not None
 
+_SPEEDTEST_CACHE = {}  # (iface, source ip) -> {"server": ..., "ts": ...}; python backend only
+SPEEDTEST_SERVER_TTL = 3600  # seconds
+
+def run_cancellable(cmd, timeout, should_stop):
+    """subprocess.run(..., capture text) that also gives up as soon as should_stop() is true."""
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            out, err = proc.communicate(timeout=0.25)
+            return subprocess.CompletedProcess(cmd, proc.returncode, out, err)
+        except subprocess.TimeoutExpired:
+            stop = should_stop()
+            if not stop and time.monotonic() < deadline:
+                continue
+            proc.terminate()
+            try:
+                proc.communicate(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+            if stop:
+                raise RuntimeError(f"{cmd[0]} cancelled")
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
 def is_ookla_speedtest() -> bool:
     if not has_cmd("speedtest"):
         return False
     out = run_cmd(["speedtest", "-V"], timeout=3)
     return "Ookla" in (out or "")
 
+def _speedtest_cli_result(data: dict, src: str, iface: str) -> dict:
+    return {"down_bps": data.get("download"), "up_bps": data.get("upload"),
+            "ping_ms": data.get("ping"), "src": src, "iface": iface}
+
+def _ookla_result(data: dict, src: str, iface: str) -> dict:
+    down_bps = data.get("download", {}).get("bandwidth")
+    up_bps = data.get("upload", {}).get("bandwidth")
+    return {
+        "down_bps": down_bps * 8 if down_bps is not None else None,  # bytes/s -> bits/s
+        "up_bps": up_bps * 8 if up_bps is not None else None,
+        "ping_ms": data.get("ping", {}).get("latency"),
+        "src": src, "iface": iface,
+    }
+
 def dbm_to_percent(dbm: int) -> int:
     if dbm is None:
         return 0
@@ -371,51 +590,64 @@ def get_saved_networks_wpa_cli(iface: str):
                 ssid_to_id.setdefault(s, nid)
     return ssids, ssid_to_id
 
+# One pass over line starts: network={ opens a block, a bare } closes it, ssid= counts only inside.
+# Lines are matched from their start, so '#' comments and quotes within values never confuse it.
+_WPA_LINE_RE = re.compile(rb'^[ \t]*(?:(network=\{)|(\})|ssid="?([^"\n]+?)"?[ \t\r]*$)', re.M)
+
 def get_saved_networks_from_conf():
     ssids = set()
     if not WPA_SUPPLICANT_CONF.exists():
         return ssids
     try:
-        content = WPA_SUPPLICANT_CONF.read_text(errors="ignore")
-    except Exception:
+        with WPA_SUPPLICANT_CONF.open('rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            in_block = False
+            for m in _WPA_LINE_RE.finditer(mm):
+                if m.group(1):
+                    in_block = True
+                elif m.group(2):
+                    in_block = False
+                elif in_block:
+                    val = m.group(3).decode(errors="ignore").strip()
+                    if val:
+                        ssids.add(val)
+    except (OSError, ValueError):  # ValueError: empty file cannot be mapped
         return ssids
-    block = False
-    for line in content.splitlines():
-        line = line.strip()
-        if line.startswith("network={"):
-            block = True
-        elif block and line.startswith("}"):
-            block = False
-        elif block and line.startswith("ssid="):
-            val = line.split("=", 1)[1].strip()
-            if val.startswith('"') and val.endswith('"'):
-                val = val[1:-1]
-            if val:
-                ssids.add(val.strip())
     return ssids
 
+def _nmcli_unescape(field: str) -> str:
+    return field.replace("\\:", ":").replace("\\\\", "\\")
+
 def get_saved_networks_nmcli():
     if not has_cmd("nmcli"):
         return set()
     ssids = set()
     try:
+        # List mode only knows general fields, so: UUIDs of Wi-Fi profiles first ...
         cp = subprocess.run(
-            ["nmcli", "-t", "-f", "NAME,TYPE", "connection", "show"],
+            ["nmcli", "-t", "-f", "UUID,TYPE", "connection", "show"],
             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=6
         )
         if cp.returncode != 0 or not cp.stdout:
             return ssids
-        names = []
+        uuids = []
         for line in cp.stdout.splitlines():
-            if not line:
-                continue
-            name, _, typ = line.partition(":")
-            if typ in ("wifi", "802-11-wireless"):
-                names.append(name)
-        for name in names:
-            ssid = run_cmd(["nmcli", "-s", "-g", "802-11-wireless.ssid", "connection", "show", name], timeout=4)
+            uuid, _, typ = line.partition(":")
+            if uuid and typ in ("wifi", "802-11-wireless"):
+                uuids.append(uuid)
+        if not uuids:
+            return ssids
+        # ... then the SSIDs of all of them in one call
+        cp = subprocess.run(
+            ["nmcli", "-t", "-g", "802-11-wireless.ssid", "connection", "show", *uuids],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=6
+        )
+        if cp.returncode != 0:
+            return ssids
+        for line in cp.stdout.splitlines():
+            ssid = _nmcli_unescape(line).strip()
             if ssid:
-                ssids.add(ssid.strip())
+                ssids.add(ssid)
     except Exception as e:
         log.debug("get_saved_networks_nmcli error: %s", e)
     return ssids
@@ -445,30 +677,81 @@ def scan_nmcli(iface: str):
             results[ssid] = {"signal": signal, "security": security}
     return results
 
+def _parse_wpa_scan_results(out: str, results: dict):
+    for line in out.splitlines()[1:]:
+        parts = line.split("\t")
+        if len(parts) >= 5:
+            try:
+                level_dbm = int(parts[2])
+            except Exception:
+                level_dbm = -90
+            flags = parts[3]
+            ssid = parts[4].strip()
+            if not ssid:
+                continue
+            pct = dbm_to_percent(level_dbm)
+            sec = flags or ""
+            if ssid not in results or pct > results[ssid]["signal"]:
+                results[ssid] = {"signal": pct, "security": sec}
+    return results
+
+def _wpa_ctrl_request(sock, cmd: bytes) -> bytes:
+    sock.send(cmd)
+    while True:
+        reply = sock.recv(16384)
+        if not reply.startswith(b"<"):  # skip unsolicited "<N>EVENT" messages
+            return reply
+
+def _wpa_ctrl_scan(iface: str, timeout=4.0):
+    """Scan over wpa_supplicant's control socket, returning as soon as
+    CTRL-EVENT-SCAN-RESULTS arrives. None if the socket is unusable."""
+    local = f"/tmp/raspap_wpa_{os.getpid()}_{threading.get_ident()}"
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        sock.bind(local)
+        sock.connect(str(WPA_CTRL_DIR / iface))
+        sock.settimeout(2)
+        if _wpa_ctrl_request(sock, b"ATTACH").strip() != b"OK":
+            return None
+        # FAIL-BUSY just means a scan is already running; wait for it all the same
+        _wpa_ctrl_request(sock, b"SCAN")
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            ready, _, _ = select.select([sock], [], [], remaining)
+            if ready and b"CTRL-EVENT-SCAN-RESULTS" in sock.recv(16384):
+                break
+        out = _wpa_ctrl_request(sock, b"SCAN_RESULTS").decode(errors="replace")
+        try:
+            _wpa_ctrl_request(sock, b"DETACH")
+        except OSError:
+            pass
+        return out
+    except OSError as e:
+        log.debug("wpa_supplicant control socket unavailable for %s: %s", iface, e)
+        return None
+    finally:
+        sock.close()
+        try:
+            os.unlink(local)
+        except OSError:
+            pass
+
 def scan_wpa_cli(iface: str):
-    _ = run_cmd(["sudo", "wpa_cli", "-i", iface, "scan"], timeout=5)
     results = {}
+    out = _wpa_ctrl_scan(iface)
+    if out is not None:
+        return _parse_wpa_scan_results(out, results)
+    # No access to the control socket (e.g. not in netdev group): poll via sudo wpa_cli
+    _ = run_cmd(["sudo", "wpa_cli", "-i", iface, "scan"], timeout=5)
     for _ in range(4):
         time.sleep(0.8)
         out = run_cmd(["sudo", "wpa_cli", "-i", iface, "scan_results"], timeout=8)
         if not out:
             continue
-        lines = out.splitlines()
-        for line in lines[1:]:
-            parts = line.split("\t")
-            if len(parts) >= 5:
-                try:
-                    level_dbm = int(parts[2])
-                except Exception:
-                    level_dbm = -90
-                flags = parts[3]
-                ssid = parts[4].strip()
-                if not ssid:
-                    continue
-                pct = dbm_to_percent(level_dbm)
-                sec = flags or ""
-                if ssid not in results or pct > results[ssid]["signal"]:
-                    results[ssid] = {"signal": pct, "security": sec}
+        _parse_wpa_scan_results(out, results)
         if results:
             break
     return results
@@ -527,6 +810,8 @@ def disconnect_client_wifi(iface: str):
 # State object – shared between screens
 # ------------------------------------------------------------
 class UiState(EventDispatcher):
+    __events__ = ('on_snapshot',)
+
     net_status = StringProperty("INIT")
     vpn_status = StringProperty("OFF")
     vpn_name = StringProperty("None")
@@ -535,6 +820,7 @@ class UiState(EventDispatcher):
     geoip = StringProperty("Unknown")
     ap_ssid = StringProperty("N/A")
     ip_address = StringProperty("N/A")
+    host_ip = StringProperty("")
     connected_clients = NumericProperty(0)
     uptime = StringProperty("N/A")
     hostname = StringProperty("N/A")
@@ -544,18 +830,40 @@ class UiState(EventDispatcher):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._hostapd_cache = {'mtime': 0, 'ssid': None, 'iface': None}
+        self._hostapd_cache = {'mtime': 0, 'ssid': None, 'iface': None, 'last_stat_mono': 0.0}
+        # Watch the directory rather than the file so editors that replace it are caught too
+        self._hostapd_watch_fd = inotify_watch(
+            HOSTAPD_CONF.parent, IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE)
+        self._hostapd_dirty = True
+        self._update_inflight = False
+        self._update_pending = False
         self._determine_interfaces()
 
+    HOSTAPD_STAT_INTERVAL = 10.0  # seconds between mtime checks of hostapd.conf (no inotify)
+
     def _read_hostapd_cached(self):
+        cache = self._hostapd_cache
+        if self._hostapd_watch_fd is not None:
+            if inotify_drain(self._hostapd_watch_fd):
+                self._hostapd_dirty = True
+            if self._hostapd_dirty:
+                self._hostapd_dirty = False
+                ssid, iface = parse_hostapd_conf()
+                cache.update(ssid=ssid, iface=iface)
+            return cache['ssid'], cache['iface']
+        now = time.monotonic()
+        if cache['last_stat_mono'] and now - cache['last_stat_mono'] < self.HOSTAPD_STAT_INTERVAL:
+            return cache['ssid'], cache['iface']
+        cache['last_stat_mono'] = now
         try:
             st = HOSTAPD_CONF.stat()
-            if st.st_mtime <= self._hostapd_cache['mtime']:
-                return self._hostapd_cache['ssid'], self._hostapd_cache['iface']
+            if st.st_mtime <= cache['mtime']:
+                return cache['ssid'], cache['iface']
             ssid, iface = parse_hostapd_conf()
-            self._hostapd_cache.update(mtime=st.st_mtime, ssid=ssid, iface=iface)
+            cache.update(mtime=st.st_mtime, ssid=ssid, iface=iface)
             return ssid, iface
         except FileNotFoundError:
+            cache.update(mtime=0, ssid=None, iface=None)
             return None, None
 
     def _determine_interfaces(self):
@@ -567,20 +875,40 @@ class UiState(EventDispatcher):
         else:
             log.warning("Could not determine AP interface from hostapd.conf, using defaults.")
 
+    async def _gather_probes(self):
+        # All probes in flight at once; wall time is the slowest one, not the sum
+        loop = asyncio.get_running_loop()
+        keys = ('client_ssid', 'hostapd', 'clients', 'vpn_running')
+        results = await asyncio.gather(
+            run_cmd_async(["iwgetid", self.host_iface, "-r"]),
+            loop.run_in_executor(None, hostapd_active),
+            loop.run_in_executor(None, raspap_api, f"clients/{self.ap_iface}"),
+            loop.run_in_executor(None, is_process_running, "openvpn"),
+            return_exceptions=True,
+        )
+        res = {}
+        for key, value in zip(keys, results):
+            if isinstance(value, Exception):
+                log.debug("Snapshot probe %s failed: %s", key, value)
+                value = None
+            res[key] = value
+        return res
+
     def collect_snapshot(self):
         snap = {}
+        res = asyncio.run_coroutine_threadsafe(self._gather_probes(), ASYNC_LOOP).result()
+
         host_ip = self._get_ip(self.host_iface)
+        snap['host_ip'] = host_ip or ""
         snap['net_status'] = "ON" if host_ip else "OFF"
-        snap['client_ssid'] = run_cmd(f"iwgetid {self.host_iface} -r") if snap['net_status'] == "ON" else "Disconnected"
-        status = run_cmd(["systemctl", "is-active", "hostapd"])
-        snap['ap_status'] = "ON" if status == "active" else "OFF"
-        raw = run_cmd(["cat", "/sys/class/thermal/thermal_zone0/temp"])
-        if raw:
-            snap['cpu_temp'] = int(raw)/1000
-        snap['hostname'] = run_cmd(["hostname"]) or "N/A"
-        uptime_output = run_cmd(["uptime", "-p"])
-        snap['uptime'] = uptime_output.replace("up ", "") if uptime_output else "N/A"
-        data = raspap_api(f"clients/{self.ap_iface}")
+        snap['client_ssid'] = res['client_ssid'] if snap['net_status'] == "ON" else "Disconnected"
+        snap['ap_status'] = "ON" if res['hostapd'] else "OFF"
+        temp = read_cpu_temp()
+        if temp is not None:
+            snap['cpu_temp'] = temp
+        snap['hostname'] = socket.gethostname() or "N/A"
+        snap['uptime'] = read_uptime() or "N/A"
+        data = res['clients']
         if isinstance(data, dict) and "active_clients" in data:
             active = data["active_clients"]
             snap['connected_clients'] = len(active) if isinstance(active, (list, dict)) else 0
@@ -589,8 +917,7 @@ class UiState(EventDispatcher):
         ssid, _ = self._read_hostapd_cached()
         snap['ap_ssid'] = ssid or "N/A"
         snap['ip_address'] = self._get_ip(self.ap_iface) or "N/A"
-        pid = run_cmd(["pgrep", "-x", "openvpn"])
-        if pid:
+        if res['vpn_running']:
             snap['vpn_status'] = "ON"
             snap['vpn_name'] = self.vpn_name if self.vpn_name != "None" else "ON"
         else:
@@ -599,25 +926,77 @@ class UiState(EventDispatcher):
         return snap
 
     def apply_snapshot(self, snap: dict):
-        for k, v in snap.items():
+        if 'cpu_temp' in snap:
+            snap['cpu_temp'] = round(snap['cpu_temp'], 1)  # ignore sub-display jitter
+        changed = {k: v for k, v in snap.items() if getattr(self, k) != v}
+        for k, v in changed.items():
             setattr(self, k, v)
+        if changed:
+            self.dispatch('on_snapshot', changed)
+
+    def on_snapshot(self, snap):
+        pass
 
     def update_async(self):
+        # At most one snapshot in flight; requests that arrive meanwhile collapse into one re-run
+        if self._update_inflight:
+            self._update_pending = True
+            return
+        self._update_inflight = True
         def _work():
-            s = self.collect_snapshot()
-            Clock.schedule_once(lambda dt: self.apply_snapshot(s), 0)
-        threading.Thread(target=_work, daemon=True).start()
-
-    def update_geoip_async(self):
+            try:
+                s = self.collect_snapshot()
+            except Exception as e:
+                log.debug("Snapshot failed: %s", e)
+                s = None
+            Clock.schedule_once(lambda dt: self._snapshot_done(s), 0)
+        STATE_POOL.submit(_work)
+
+    def _snapshot_done(self, snap):
+        self._update_inflight = False
+        if snap:
+            self.apply_snapshot(snap)
+        if self._update_pending:
+            self._update_pending = False
+            self.update_async()
+
+    def update_geoip_async(self, use_cache=False):
+        """use_cache=True (periodic timer only) serves a cached result younger than
+        GEOIP_CACHE_TTL without any network call; net/VPN changes always re-query.
+
+        Only those triggered lookups write the cache, and each one drops it first,
+        so a failed lookup after the IP changed never leaves the old city behind.
+        """
         def _task():
-            url = "http://ip-api.com/json/?fields=status,message,country,city"
+            if not use_cache:
+                try:
+                    GEOIP_CACHE_FILE.unlink(missing_ok=True)
+                except OSError as e:
+                    log.debug("Could not clear GeoIP cache: %s", e)
+            else:
+                try:
+                    cache = json.loads(GEOIP_CACHE_FILE.read_text())
+                except (OSError, ValueError):
+                    cache = {}
+                if cache.get("geoip") and time.time() - cache.get("ts", 0) < GEOIP_CACHE_TTL:
+                    log.debug("GeoIP cache hit for %s", cache.get("ip"))
+                    return cache["geoip"]
+
+            url = "http://ip-api.com/json/?fields=status,message,country,city,query"
             r = HTTP.get(url, timeout=5)
             r.raise_for_status()
             data = r.json()
             if data.get('status') == 'success':
                 city = data.get('city', 'N/A')
                 country = data.get('country', 'N/A')
-                return f"{city}, {country}"
+                geoip = f"{city}, {country}"
+                if not use_cache:
+                    try:
+                        GEOIP_CACHE_FILE.write_text(json.dumps(
+                            {"ip": data.get("query"), "geoip": geoip, "ts": time.time()}))
+                    except OSError as e:
+                        log.debug("Could not write GeoIP cache: %s", e)
+                return geoip
             return "API Error"
         def _done(result, err):
             if err:
@@ -630,19 +1009,15 @@ class UiState(EventDispatcher):
 
     @staticmethod
     def _get_ip(iface):
-        out = run_cmd(["ip", "-j", "-4", "addr", "show", iface])
-        if not out:
-            return None
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         try:
-            data = json.loads(out)
-            if data and isinstance(data, list):
-                addr_info = data[0].get('addr_info')
-                if addr_info and isinstance(addr_info, list):
-                    return addr_info[0].get('local')
-        except (json.JSONDecodeError, IndexError, KeyError) as e:
-            log.debug("Could not parse IP address from JSON for %s: %s", iface, e)
-        return None
-
+            req = struct.pack('256s', iface.encode()[:15])
+            return socket.inet_ntoa(fcntl.ioctl(sock.fileno(), SIOCGIFADDR, req)[20:24])
+        except OSError:
+            # No such interface, or no IPv4 address assigned
+            return None
+        finally:
+            sock.close()
 
 STATE = UiState()
 
@@ -662,7 +1037,7 @@ def _vpn_iface_with_ip():
     return None, None
 
 def _is_openvpn_running():
-    return bool(run_cmd(["pgrep", "-x", "openvpn"], timeout=2))
+    return is_process_running("openvpn")
 
 def _wait_for_vpn_up(timeout=40, interval=0.5):
     start = time.time()
@@ -691,8 +1066,38 @@ def _wait_for_vpn_down(timeout=15, interval=0.5):
 class ThemedButton(Button):
     bg_color = ListProperty(THEME.BUTTON_BG_NORMAL)
 
+NAV_ICONS = (u"\uf1eb", u"\uf3ed", u"\uf011", u"\uf05a")
+ICON_CACHE = {}
+
+def _font_px(size) -> float:
+    m = re.match(r'^\s*([\d.]+)\s*([a-z]*)', str(size))
+    if not m:
+        return 22.0
+    value, unit = m.groups()
+    return dpi2px(float(value), unit) if unit else float(value)
+
+def get_icon_texture(glyph: str):
+    """Font Awesome glyph rendered once; tinted by the button's Color at draw time."""
+    tex = ICON_CACHE.get(glyph)
+    if tex is None:
+        core = CoreLabel(text=glyph, font_name="FontAwesome", font_size=_font_px(THEME.FONT_SIZE_NORMAL))
+        core.refresh()
+        tex = ICON_CACHE[glyph] = core.texture
+    return tex
+
+def prerender_icons():
+    for glyph in NAV_ICONS:
+        try:
+            get_icon_texture(glyph)
+        except Exception as e:
+            log.error(f"Could not render icon {glyph!r}: {e}")
+
 class NavButton(ThemedButton):
-    pass
+    icon = StringProperty("")
+    icon_texture = ObjectProperty(None, allownone=True)
+
+    def on_icon(self, instance, glyph):
+        self.icon_texture = get_icon_texture(glyph) if glyph else None
 
 class HeaderLayout(BoxLayout):
     pass
@@ -708,12 +1113,6 @@ class MainScreen(Screen):
     def __init__(self, **kw):
         super().__init__(**kw)
         overall_layout = BoxLayout(orientation='vertical', padding=THEME.PADDING, spacing=THEME.SPACING)
-        overall_layout.canvas.before.clear()
-        from kivy.graphics import Color, Rectangle
-        with overall_layout.canvas.before:
-            Color(*THEME.BACKGROUND_COLOR)
-            self.rect = Rectangle(pos=overall_layout.pos, size=overall_layout.size)
-            overall_layout.bind(pos=self.update_rect, size=self.update_rect)
 
         header_layout = HeaderLayout(orientation='horizontal', size_hint_y=None, height=THEME.BUTTON_HEIGHT + 10, spacing=5, padding=(0, 5))
         logo_image = Image(source=str(ASSETS_DIR / 'raspAP-logo.png'), size_hint_x=0.2, allow_stretch=True, keep_ratio=True)
@@ -751,14 +1150,14 @@ class MainScreen(Screen):
         content_area.add_widget(label_col)
         content_area.add_widget(value_col)
 
-        self.wifi_button = NavButton(text=u"\uf1eb", on_press=self.on_net)
+        self.wifi_button = NavButton(icon=u"\uf1eb", on_press=self.on_net)
         btn_col.add_widget(self.wifi_button)
 
-        self.vpn_button = NavButton(text=u"\uf3ed", on_press=self.on_vpn)
+        self.vpn_button = NavButton(icon=u"\uf3ed", on_press=self.on_vpn)
         btn_col.add_widget(self.vpn_button)
 
-        btn_col.add_widget(NavButton(text=u"\uf011", on_press=self.on_sys))
-        btn_col.add_widget(NavButton(text=u"\uf05a", on_press=self.on_info))
+        btn_col.add_widget(NavButton(icon=u"\uf011", on_press=self.on_sys))
+        btn_col.add_widget(NavButton(icon=u"\uf05a", on_press=self.on_info))
 
         content_area.add_widget(btn_col)
         overall_layout.add_widget(content_area)
@@ -768,28 +1167,26 @@ class MainScreen(Screen):
         # GeoIP refresh handled at app-level triggers
 
     def _bind_state_to_ui(self):
-        def set_value(key, value):
-            if key in self.value_labels:
-                self.value_labels[key].text = str(value)
-
-        STATE.bind(client_ssid=lambda i, v: set_value("Net:", v))
-
-        def on_vpn_change(*_):
-            set_value("VPN:", STATE.vpn_name if STATE.vpn_status == "ON" else "Disconnected")
-            self.vpn_button.bg_color = THEME.ACCENT_COLOR if STATE.vpn_status == "ON" else THEME.BUTTON_BG_NORMAL
-
-        STATE.bind(vpn_status=lambda *a: on_vpn_change(), vpn_name=lambda *a: on_vpn_change())
-        STATE.bind(connected_clients=lambda i, v: set_value("Clients:", v))
-        STATE.bind(cpu_temp=lambda i, v: set_value("CPU°:", f"{v:.1f} °C"))
-        STATE.bind(geoip=lambda i, v: set_value("GeoIP:", v))
-        STATE.bind(uptime=lambda i, v: set_value("Uptime:", v))
-
+        # One deferred pass over all labels per snapshot instead of one callback per property.
+        # geoip/vpn_* are also written outside snapshots (GeoIP task, VPN screen), so watch those too.
+        self._ui_trigger = Clock.create_trigger(self._broadcast_updates, 0)
+        STATE.bind(on_snapshot=lambda *a: self._ui_trigger(),
+                   geoip=lambda *a: self._ui_trigger(),
+                   vpn_status=lambda *a: self._ui_trigger(),
+                   vpn_name=lambda *a: self._ui_trigger())
+
+    def _broadcast_updates(self, *_):
+        labels = self.value_labels
+        vpn_on = STATE.vpn_status == "ON"
+        labels["Net:"].text = str(STATE.client_ssid)
+        labels["VPN:"].text = STATE.vpn_name if vpn_on else "Disconnected"
+        labels["Clients:"].text = str(STATE.connected_clients)
+        labels["CPU°:"].text = f"{STATE.cpu_temp:.1f} °C"
+        labels["GeoIP:"].text = str(STATE.geoip)
+        labels["Uptime:"].text = str(STATE.uptime)
+        self.vpn_button.bg_color = THEME.ACCENT_COLOR if vpn_on else THEME.BUTTON_BG_NORMAL
         # Wi-Fi button: green when connected, red when disconnected
-        STATE.bind(net_status=lambda i, v: setattr(self.wifi_button, "bg_color", THEME.ACCENT_COLOR if v == "ON" else THEME.BUTTON_BG_OFF))
-
-    def update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
+        self.wifi_button.bg_color = THEME.ACCENT_COLOR if STATE.net_status == "ON" else THEME.BUTTON_BG_OFF
 
     def on_pre_enter(self, *_):
         self._sync_once()
@@ -817,12 +1214,6 @@ class SystemScreen(Screen):
     def __init__(self, **kw):
         super().__init__(**kw)
         root = BoxLayout(orientation='vertical', padding=THEME.PADDING, spacing=THEME.SPACING)
-        root.canvas.before.clear()
-        from kivy.graphics import Color, Rectangle
-        with root.canvas.before:
-            Color(*THEME.BACKGROUND_COLOR)
-            self.rect = Rectangle(pos=root.pos, size=root.size)
-            root.bind(pos=self.update_rect, size=self.update_rect)
 
         title = Label(text="[b]System Control[/b]", font_size=THEME.FONT_SIZE_TITLE, color=THEME.TEXT_COLOR_DARK,
                       size_hint_y=None, height=THEME.BUTTON_HEIGHT * 1.5, markup=True)
@@ -839,10 +1230,6 @@ class SystemScreen(Screen):
 
         self.add_widget(root)
 
-    def update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
-
     def on_reboot(self, *_):
         self._confirm_and_run("REBOOT", "Are you sure?", ["sudo", "systemctl", "reboot"], "Rebooting Pi...")
 
@@ -866,8 +1253,12 @@ class SystemScreen(Screen):
         def _do(*args):
             popup.dismiss()
             show_busy_indicator()
-            run_bg(lambda: subprocess.run(cmd, check=False))
-            Clock.schedule_once(lambda dt: hide_busy_indicator(), 15)
+            # Tie the spinner to the command itself rather than a fixed delay
+            def _finished(result, err):
+                hide_busy_indicator()
+                if err or result.returncode != 0:
+                    show_message(title, "Command failed", is_error=True)
+            run_bg(lambda: subprocess.run(cmd, check=False), _finished, daemon=True)
 
         ok_button.bind(on_release=_do)
         cancel_button.bind(on_release=lambda *_: popup.dismiss())
@@ -878,12 +1269,6 @@ class InfoScreen(Screen):
     def __init__(self, **kw):
         super().__init__(**kw)
         root = BoxLayout(orientation='vertical', padding=THEME.PADDING, spacing=THEME.SPACING)
-        root.canvas.before.clear()
-        from kivy.graphics import Color, Rectangle
-        with root.canvas.before:
-            Color(*THEME.BACKGROUND_COLOR)
-            self.rect = Rectangle(pos=root.pos, size=root.size)
-            root.bind(pos=self.update_rect, size=self.update_rect)
 
         # 3-column grid: Label | Value | Action (button/blank)
         self.grid = GridLayout(cols=3, spacing=(THEME.SPACING, 2), size_hint_y=None, size_hint_x=1)
@@ -962,14 +1347,19 @@ class InfoScreen(Screen):
 
         self.add_widget(root)
 
-        self.scroll_view.bind(width=lambda *_: self._update_info_col_widths())
-        self.grid.bind(width=lambda *_: self._update_info_col_widths())
-        Clock.schedule_once(lambda dt: self._update_info_col_widths(), 0)
+        # Width changes arrive in bursts (scroll view + grid); lay the columns out once per frame
+        self._col_trigger = Clock.create_trigger(self._do_col_width_update, 0)
+        self.scroll_view.bind(width=self._col_trigger)
+        self.grid.bind(width=self._col_trigger)
+        self._col_trigger()
 
-        self._refresh_ev = None
+        self._refresh_trigger = Clock.create_trigger(lambda dt: self.refresh(), 0.1)
         self._speedtest_running = False
+        self._speedtest_cancel = False
+        self._last_text = {}
+        STATE.bind(host_ip=lambda i, v: self._set_info("Internet IP", v or "N/A"))
 
-    def _update_info_col_widths(self):
+    def _do_col_width_update(self, *_):
         total = max(1, self.grid.width)
         spacing_total = self.grid.spacing[0] * 2 if isinstance(self.grid.spacing, (list, tuple)) else self.grid.spacing
         action_w = max(70, int(total * 0.10))
@@ -989,21 +1379,24 @@ class InfoScreen(Screen):
             except Exception:
                 pass
 
+    INFO_FIELDS = ('ap_status', 'ap_ssid', 'ip_address', 'connected_clients', 'hostname', 'uptime',
+                   'cpu_temp', 'geoip', 'vpn_status', 'vpn_name', 'client_ssid')
+
     def on_pre_enter(self, *_):
-        self._refresh_ev = Clock.schedule_interval(lambda dt: self.refresh(), CONFIG.get("update_interval", 2))
+        # Refresh on STATE changes (bursts collapse into one pass) rather than on a fixed timer
+        STATE.bind(**{f: self._refresh_trigger for f in self.INFO_FIELDS})
+        if self._speedtest_running:
+            self._speedtest_cancel = False  # back before the backend noticed; let it finish
         self.refresh()
 
     def on_leave(self, *_):
-        if self._refresh_ev:
-            self._refresh_ev.cancel()
-            self._refresh_ev = None
-
-    def update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
+        STATE.unbind(**{f: self._refresh_trigger for f in self.INFO_FIELDS})
+        self._refresh_trigger.cancel()
+        if self._speedtest_running:
+            self._speedtest_cancel = True  # CLI backends notice within ~0.25 s
 
     def refresh(self):
-        ip_host = STATE._get_ip(STATE.host_iface) or "N/A"
+        ip_host = STATE.host_ip or "N/A"
         info_data = {
             "AP Status": STATE.ap_status,
             "AP SSID": STATE.ap_ssid,
@@ -1017,8 +1410,14 @@ class InfoScreen(Screen):
             "Internet SSID": STATE.client_ssid,
             "Internet IP": ip_host,
         }
-        for key, label in self.info_labels.items():
-            label.text = str(info_data.get(key, "N/A"))
+        for key in self.info_labels:
+            self._set_info(key, str(info_data.get(key, "N/A")))
+
+    def _set_info(self, key, text):
+        # Only touch label.text (and its texture) when the string really changed
+        if self._last_text.get(key) != text:
+            self.info_labels[key].text = text
+            self._last_text[key] = text
 
     def run_speed_test(self, *_):
         if self._speedtest_running:
@@ -1034,110 +1433,98 @@ class InfoScreen(Screen):
 
         self._speedtest_running = True
         self.speed_btn.disabled = True
+        # No modal spinner here: progress shows in the row and Back stays usable (leaving cancels)
         self.speed_value.text = f"Testing on {host_iface}..."
-        show_busy_indicator()
+
+        self._speedtest_cancel = False
+        _cancelled = lambda: self._speedtest_cancel
 
         def _task():
             errors = []
 
             # 1) Python module (provided by pip install speedtest-cli)
-            try:
-                import speedtest as st_mod
-                st = st_mod.Speedtest(source_address=host_ip)
-                st.get_servers()
-                st.get_best_server()
-                down_bps = st.download()
-                up_bps = st.upload(pre_allocate=False)
-                ping_ms = getattr(st.results, 'ping', None)
-                if ping_ms is None:
-                    try:
-                        ping_ms = st.results.dict().get('ping')
-                    except Exception:
-                        pass
-                return {"down_bps": down_bps, "up_bps": up_bps, "ping_ms": ping_ms, "src": "py", "iface": host_iface}
-            except ImportError:
-                errors.append("python: module 'speedtest' not installed (pip3 install speedtest-cli)")
-            except Exception as e_py:
-                errors.append(f"python: {e_py}")
+            def _py():
+                try:
+                    import speedtest as st_mod
+                    st = st_mod.Speedtest(source_address=host_ip)
+                    cache_key = (host_iface, host_ip)
+                    cached = _SPEEDTEST_CACHE.get(cache_key)
+                    if cached and time.monotonic() - cached["ts"] < SPEEDTEST_SERVER_TTL:
+                        # Skip the server-list download; just re-ping last run's best server
+                        st.get_best_server([cached["server"]])
+                    else:
+                        st.get_servers()
+                        st.get_best_server()
+                        _SPEEDTEST_CACHE[cache_key] = {"server": st.best, "ts": time.monotonic()}
+                    down_bps = st.download()
+                    up_bps = st.upload(pre_allocate=False)
+                    ping_ms = getattr(st.results, 'ping', None)
+                    if ping_ms is None:
+                        try:
+                            ping_ms = st.results.dict().get('ping')
+                        except Exception:
+                            pass
+                    return {"down_bps": down_bps, "up_bps": up_bps, "ping_ms": ping_ms, "src": "py", "iface": host_iface}
+                except ImportError:
+                    errors.append("python: module 'speedtest' not installed (pip3 install speedtest-cli)")
+                except Exception as e_py:
+                    errors.append(f"python: {e_py}")
+                return None
 
             # 2) sivel CLI (speedtest-cli)
-            if has_cmd("speedtest-cli"):
+            def _cli():
+                if not has_cmd("speedtest-cli"):
+                    errors.append("speedtest-cli: not installed")
+                    return None
                 try:
-                    cp = subprocess.run(
-                        ["speedtest-cli", "--json", "--source", host_ip],
-                        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=120
-                    )
-                    if cp.returncode == 0 and cp.stdout:
-                        data = json.loads(cp.stdout)
-                        return {
-                            "down_bps": data.get("download"),
-                            "up_bps": data.get("upload"),
-                            "ping_ms": data.get("ping"),
-                            "src": "cli",
-                            "iface": host_iface
-                        }
-                    else:
-                        errors.append(f"speedtest-cli: rc={cp.returncode} err={ (cp.stderr or cp.stdout or '').strip() }")
-                        # Retry without binding to source IP
-                        cp2 = subprocess.run(
-                            ["speedtest-cli", "--json"],
-                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=120
-                        )
-                        if cp2.returncode == 0 and cp2.stdout:
-                            data = json.loads(cp2.stdout)
-                            return {
-                                "down_bps": data.get("download"),
-                                "up_bps": data.get("upload"),
-                                "ping_ms": data.get("ping"),
-                                "src": "cli*",
-                                "iface": host_iface
-                            }
-                        else:
-                            errors.append(f"speedtest-cli(no-source): rc={cp2.returncode} err={ (cp2.stderr or cp2.stdout or '').strip() }")
+                    # Bound to the client interface first, then unbound
+                    for cmd, src, tag in ((["speedtest-cli", "--json", "--source", host_ip], "cli", "speedtest-cli"),
+                                          (["speedtest-cli", "--json"], "cli*", "speedtest-cli(no-source)")):
+                        cp = run_cancellable(cmd, 120, _cancelled)
+                        if cp.returncode == 0 and cp.stdout:
+                            return _speedtest_cli_result(json.loads(cp.stdout), src, host_iface)
+                        errors.append(f"{tag}: rc={cp.returncode} err={ (cp.stderr or cp.stdout or '').strip() }")
                 except Exception as e_cli:
                     errors.append(f"speedtest-cli: {e_cli}")
-            else:
-                errors.append("speedtest-cli: not installed")
+                return None
 
             # 3) Ookla CLI (speedtest)
-            if is_ookla_speedtest():
+            def _ookla():
+                if not ookla_probe.result():
+                    errors.append("ookla: 'speedtest' not found or not Ookla CLI")
+                    return None
                 try:
-                    cmd = ["speedtest", "--accept-license", "--accept-gdpr", "--ip-protocol=ipv4", "-f", "json", "--interface", host_iface]
-                    cp = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=120)
-                    if cp.returncode == 0 and cp.stdout:
-                        data = json.loads(cp.stdout)
-                        down_bps = data.get("download", {}).get("bandwidth")
-                        up_bps = data.get("upload", {}).get("bandwidth")
-                        ping_ms = data.get("ping", {}).get("latency")
-                        if down_bps is not None: down_bps *= 8  # bytes/s -> bits/s
-                        if up_bps is not None: up_bps *= 8
-                        return {"down_bps": down_bps, "up_bps": up_bps, "ping_ms": ping_ms, "src": "ookla", "iface": host_iface}
-                    else:
-                        errors.append(f"ookla(iface): rc={cp.returncode} err={ (cp.stderr or cp.stdout or '').strip() }")
-                        # Retry without interface pinning
-                        cmd2 = ["speedtest", "--accept-license", "--accept-gdpr", "--ip-protocol=ipv4", "-f", "json"]
-                        cp2 = subprocess.run(cmd2, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=120)
-                        if cp2.returncode == 0 and cp2.stdout:
-                            data = json.loads(cp2.stdout)
-                            down_bps = data.get("download", {}).get("bandwidth")
-                            up_bps = data.get("upload", {}).get("bandwidth")
-                            ping_ms = data.get("ping", {}).get("latency")
-                            if down_bps is not None: down_bps *= 8
-                            if up_bps is not None: up_bps *= 8
-                            return {"down_bps": down_bps, "up_bps": up_bps, "ping_ms": ping_ms, "src": "ookla*", "iface": host_iface}
-                        else:
-                            errors.append(f"ookla(no-iface): rc={cp2.returncode} err={ (cp2.stderr or cp2.stdout or '').strip() }")
+                    base = ["speedtest", "--accept-license", "--accept-gdpr", "--ip-protocol=ipv4", "-f", "json"]
+                    # Pinned to the client interface first, then unpinned
+                    for cmd, src, tag in ((base + ["--interface", host_iface], "ookla", "ookla(iface)"),
+                                          (base, "ookla*", "ookla(no-iface)")):
+                        cp = run_cancellable(cmd, 120, _cancelled)
+                        if cp.returncode == 0 and cp.stdout:
+                            return _ookla_result(json.loads(cp.stdout), src, host_iface)
+                        errors.append(f"{tag}: rc={cp.returncode} err={ (cp.stderr or cp.stdout or '').strip() }")
                 except Exception as e_ook:
                     errors.append(f"ookla: {e_ook}")
-            else:
-                errors.append("ookla: 'speedtest' not found or not Ookla CLI")
+                return None
+
+            # Backends run one at a time: concurrent tests would split the link and
+            # report nonsense. Only the `speedtest -V` probe is overlapped with them.
+            with ThreadPoolExecutor(max_workers=1) as probe:
+                ookla_probe = probe.submit(is_ookla_speedtest)
+                for backend in (_py, _cli, _ookla):
+                    if _cancelled():
+                        raise RuntimeError("Speed test cancelled")
+                    result = backend()
+                    if result:
+                        return result
 
             raise RuntimeError("No speedtest backend available or all failed. " + "; ".join(errors[:3]))
 
         def _done(result, err):
-            hide_busy_indicator()
             self._speedtest_running = False
             self.speed_btn.disabled = False
+            if err and self._speedtest_cancel:
+                self.speed_value.text = "Cancelled"
+                return
             if err:
                 show_message("Speed Test", str(err), is_error=True, position='center')
                 self.speed_value.text = "Failed"
@@ -1152,7 +1539,7 @@ class InfoScreen(Screen):
             # Two-line display
             self.speed_value.text = f"[{iface}/{src}] {ping}\n{down}↓ / {up}↑ Mbps"
 
-        run_bg(_task, _done)
+        run_bg(_task, _done, daemon=True)
 
 
 class WifiScreen(Screen):
@@ -1160,14 +1547,12 @@ class WifiScreen(Screen):
         super().__init__(**kw)
         self._connecting = False
         self._auto_jobs = []
+        self._wifi_row_pool = {}
+        self._info_row_pool = {}
+        self._error_label = None
+        self._retry_if_empty = False
 
         root = BoxLayout(orientation='vertical', padding=THEME.PADDING, spacing=THEME.SPACING)
-        root.canvas.before.clear()
-        from kivy.graphics import Color, Rectangle
-        with root.canvas.before:
-            Color(*THEME.BACKGROUND_COLOR)
-            self.rect = Rectangle(pos=root.pos, size=root.size)
-            root.bind(pos=self.update_rect, size=self.update_rect)
 
         title = Label(text="[b]Wi‑Fi Networks[/b]", markup=True, font_size=THEME.FONT_SIZE_TITLE,
                       color=THEME.TEXT_COLOR_DARK, size_hint_y=None, height=THEME.BUTTON_HEIGHT * 1.1)
@@ -1211,9 +1596,8 @@ class WifiScreen(Screen):
         self._update_current_ssid(STATE, STATE.client_ssid)
 
     def on_enter(self, *_):
+        self._retry_if_empty = True
         self.refresh_networks()
-        self._schedule_auto_refresh(1.5)
-        self._schedule_auto_refresh(3.0)
 
     def on_leave(self, *_):
         for ev in self._auto_jobs:
@@ -1227,18 +1611,47 @@ class WifiScreen(Screen):
         ev = Clock.schedule_once(lambda dt: self.refresh_networks(), delay)
         self._auto_jobs.append(ev)
 
-    def update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
-
     def _update_current_ssid(self, instance, ssid):
         self.current_lbl.text = f"Current: {ssid or '—'}"
 
-    def _add_info_row(self, text):
+    @staticmethod
+    def _make_info_label(text=""):
         lbl = Label(text=text, font_size=THEME.FONT_SIZE_SMALL, color=THEME.TEXT_COLOR_DARK,
                     halign='left', valign='middle', size_hint_y=None, height=24)
         lbl.bind(size=lbl.setter('text_size'))
-        self.list_grid.add_widget(lbl)
+        return lbl
+
+    def _info_row(self, text):
+        # Fixed messages only; anything variable goes through _error_row
+        lbl = self._info_row_pool.get(text)
+        if lbl is None:
+            lbl = self._info_row_pool[text] = self._make_info_label(text)
+        return lbl
+
+    def _error_row(self, text):
+        if self._error_label is None:
+            self._error_label = self._make_info_label()
+        self._error_label.text = text
+        return self._error_label
+
+    def _wifi_row(self, ssid):
+        btn = self._wifi_row_pool.get(ssid)
+        if btn is None:
+            btn = ThemedButton()
+            btn.connect_cb = None
+            self._wifi_row_pool[ssid] = btn
+        elif btn.connect_cb is not None:
+            btn.unbind(on_release=btn.connect_cb)
+            btn.connect_cb = None
+        return btn
+
+    def _show_rows(self, rows):
+        # Leave the grid alone when the row order is unchanged; otherwise re-seat pooled widgets
+        if list(reversed(self.list_grid.children)) != rows:
+            self.list_grid.clear_widgets()
+            for w in rows:
+                self.list_grid.add_widget(w)
+        self._wifi_row_pool = {s: b for s, b in self._wifi_row_pool.items() if b in rows}
 
     def on_disconnect(self, *_):
         if self._connecting:
@@ -1256,13 +1669,13 @@ class WifiScreen(Screen):
                 STATE.update_async()
                 if self.manager:
                     self.manager.current = "main"
-        run_bg(_task, _done)
+        run_bg(_task, _done, daemon=True)
 
     def refresh_networks(self):
         if self._connecting:
             return
-        self.list_grid.clear_widgets()
-        self._add_info_row("Scanning saved networks in range...")
+        if not self.list_grid.children:
+            self._show_rows([self._info_row("Scanning saved networks in range...")])
         show_busy_indicator()
 
         iface = STATE.host_iface
@@ -1274,21 +1687,21 @@ class WifiScreen(Screen):
             saved = {s.strip() for s in saved_wpa} | {s.strip() for s in saved_nm}
             nm = scan_nmcli(iface) if has_cmd("nmcli") else {}
             wp = scan_wpa_cli(iface)
+            # Scanners already strip SSIDs; keep the strongest sighting of each
             merged = {}
-            for src in (nm, wp):
-                for ssid, info in src.items():
-                    if ssid not in merged or info["signal"] > merged[ssid]["signal"]:
-                        merged[ssid] = info
-            in_range = []
-            for ssid, info in merged.items():
-                s = ssid.strip() if ssid else ""
-                if s and s in saved:
-                    in_range.append({
-                        "ssid": s,
-                        "signal": info.get("signal", 0),
-                        "security": info.get("security", ""),
-                        "current": (s == current_ssid)
-                    })
+            for ssid, info in itertools.chain(nm.items(), wp.items()):
+                cur = merged.get(ssid)
+                if cur is None or info["signal"] > cur["signal"]:
+                    merged[ssid] = info
+            in_range = [
+                {
+                    "ssid": ssid,
+                    "signal": info.get("signal", 0),
+                    "security": info.get("security", ""),
+                    "current": (ssid == current_ssid)
+                }
+                for ssid, info in merged.items() if ssid and ssid in saved
+            ]
             # Sort: current first, then by descending signal
             in_range.sort(key=lambda x: (x["current"] is False, -x["signal"]))
             # Determine saved-but-out-of-range
@@ -1298,15 +1711,21 @@ class WifiScreen(Screen):
 
         def _done(result, err):
             hide_busy_indicator()
-            self.list_grid.clear_widgets()
+            # Only the first scan after entering may retry, whatever it returned
+            retry, self._retry_if_empty = self._retry_if_empty, False
             if err or not result:
-                self._add_info_row(f"Scan failed: {err}" if err else "No saved networks found.")
+                self._show_rows([self._error_row(f"Scan failed: {err}") if err
+                                 else self._info_row("No saved networks found.")])
                 return
             in_range = result["in_range"]
             out_of_range = result["out_of_range"]
+            # A scan that lands before the driver has results shows nothing in range; re-check once
+            if retry and not in_range:
+                self._schedule_auto_refresh(2.0)
 
+            rows = []
             if not in_range and not out_of_range:
-                self._add_info_row("No saved networks found in range.")
+                rows.append(self._info_row("No saved networks found in range."))
             else:
                 # Show in-range networks (current at top, disabled)
                 for item in in_range:
@@ -1314,26 +1733,30 @@ class WifiScreen(Screen):
                     sig = item["signal"]
                     sec = item["security"] or ""
                     secure = any(k in sec for k in ("WPA", "WEP", "SAE"))
-                    fa_icon = "\uf023" if secure else "\uf09c"
-                    label_text = f"{ssid}   {sig}% [font={FA_FONT_FILE}]{fa_icon}[/font]"
-                    btn = ThemedButton(text=label_text)
+                    btn = self._wifi_row(ssid)
+                    btn.text = f"{ssid}   {sig}% {_FA_LOCK if secure else _FA_OPEN}"
                     if item["current"]:
                         btn.disabled = True
                         btn.bg_color = THEME.ACCENT_COLOR
                     else:
-                        btn.bind(on_release=partial(self._connect_to, ssid))
-                    self.list_grid.add_widget(btn)
+                        btn.disabled = False
+                        btn.bg_color = THEME.BUTTON_BG_NORMAL
+                        btn.connect_cb = partial(self._connect_to, ssid)
+                        btn.bind(on_release=btn.connect_cb)
+                    rows.append(btn)
 
                 # Show saved out-of-range section if any
                 if out_of_range:
-                    self._add_info_row("Saved (out of range):")
+                    rows.append(self._info_row("Saved (out of range):"))
                     for ssid in out_of_range:
-                        btn = ThemedButton(text=f"{ssid}   out of range")
+                        btn = self._wifi_row(ssid)
+                        btn.text = f"{ssid}   out of range"
                         btn.disabled = True
                         btn.bg_color = THEME.BUTTON_BG_PRESSED
-                        self.list_grid.add_widget(btn)
+                        rows.append(btn)
+            self._show_rows(rows)
 
-        run_bg(_task, _done)
+        run_bg(_task, _done, daemon=True)
 
     def _connect_to(self, ssid, *_):
         if self._connecting:
@@ -1359,20 +1782,15 @@ class WifiScreen(Screen):
                 Clock.schedule_once(lambda dt: STATE.update_geoip_async(), 1)
                 if self.manager:
                     self.manager.current = "main"
-        run_bg(_task, _done)
+        run_bg(_task, _done, daemon=True)
 
 
 class VpnScreen(Screen):
     def __init__(self, **kw):
         super().__init__(**kw)
         self.vpn_button_grid = None
+        self._vpn_buttons = []
         root = BoxLayout(orientation='vertical', padding=THEME.PADDING, spacing=THEME.SPACING)
-        root.canvas.before.clear()
-        from kivy.graphics import Color, Rectangle
-        with root.canvas.before:
-            Color(*THEME.BACKGROUND_COLOR)
-            self.rect = Rectangle(pos=root.pos, size=root.size)
-            root.bind(pos=self.update_rect, size=self.update_rect)
 
         root.add_widget(Label(text="[b]VPN Control[/b]", font_size=THEME.FONT_SIZE_TITLE, color=THEME.TEXT_COLOR_DARK, size_hint_y=None, height=40, markup=True))
 
@@ -1389,33 +1807,44 @@ class VpnScreen(Screen):
         self.add_widget(root)
 
         self.bind(on_enter=self.populate_vpn_buttons)
+        # vpn_status and vpn_name usually flip together; rebuild once per frame at most
+        self._rebuild_trigger = Clock.create_trigger(self.populate_vpn_buttons, 0)
         STATE.bind(vpn_status=self._on_state_change, vpn_name=self._on_state_change)
 
     def _on_state_change(self, *args):
-        self.populate_vpn_buttons()
-
-    def update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
+        self._rebuild_trigger()
 
     def populate_vpn_buttons(self, *args):
-        self.vpn_button_grid.clear_widgets()
-        vpn_configs = CONFIG.get("vpn_profiles", [])
+        # Buttons are kept between calls; only their text/colour/callback are refreshed
+        vpn_configs = [c for c in CONFIG.get("vpn_profiles", []) if c.get("file")]
         if not vpn_configs:
-            self.vpn_button_grid.add_widget(Label(text="No VPN profiles in config.json.", color=THEME.TEXT_COLOR_DARK))
+            if not self.vpn_button_grid.children:
+                self.vpn_button_grid.add_widget(Label(text="No VPN profiles in config.json.", color=THEME.TEXT_COLOR_DARK))
             return
-        for config in vpn_configs:
+        for i, config in enumerate(vpn_configs):
             display_name = config.get("display_name", "Unnamed")
-            vpn_file = config.get("file")
-            if not vpn_file:
-                continue
-            button = ThemedButton(text=display_name)
+            vpn_file = config["file"]
+            if i < len(self._vpn_buttons):
+                button = self._vpn_buttons[i]
+            else:
+                button = ThemedButton()
+                button.vpn_cb = None
+                self._vpn_buttons.append(button)
+                self.vpn_button_grid.add_widget(button)
+            button.text = display_name
+            button.opacity = 1
+            button.disabled = False
             if STATE.vpn_status == "ON" and STATE.vpn_name == display_name:
                 button.bg_color = THEME.ACCENT_COLOR
             else:
                 button.bg_color = THEME.BUTTON_BG_NORMAL
-            button.bind(on_release=partial(self.toggle_vpn, vpn_file, display_name))
-            self.vpn_button_grid.add_widget(button)
+            if button.vpn_cb is not None:
+                button.unbind(on_release=button.vpn_cb)
+            button.vpn_cb = partial(self.toggle_vpn, vpn_file, display_name)
+            button.bind(on_release=button.vpn_cb)
+        for button in self._vpn_buttons[len(vpn_configs):]:
+            button.opacity = 0
+            button.disabled = True
 
     def toggle_vpn(self, vpn_file, display_name, *args):
         show_busy_indicator()
@@ -1446,7 +1875,7 @@ class VpnScreen(Screen):
             if self.manager:
                 self.manager.current = "main"
 
-        run_bg(_task, _done)
+        run_bg(_task, _done, daemon=True)
 
     def disconnect_vpn(self, *args):
         show_busy_indicator()
@@ -1472,7 +1901,7 @@ class VpnScreen(Screen):
             if self.manager:
                 self.manager.current = "main"
 
-        run_bg(_task, _done)
+        run_bg(_task, _done, daemon=True)
 
 
 # ------------------------------------------------------------
@@ -1487,13 +1916,20 @@ class StatePoller:
     def start(self):
         if self._event:
             return
-        self._event = Clock.schedule_interval(lambda dt: self.state.update_async(), self.interval)
+        self._event = Clock.schedule_interval(self._tick, self.interval)
+
+    def _tick(self, dt):
+        self.state.update_async()
 
     def stop(self):
         if self._event:
             self._event.cancel()
             self._event = None
 
+    @property
+    def running(self):
+        return self._event is not None
+
 
 class RaspApTouchApp(App):
     def build(self):
@@ -1519,7 +1955,7 @@ class RaspApTouchApp(App):
         RoundedRectangle:
             size: self.size
             pos: self.pos
-            radius: [app.theme.PADDING/2,]
+            radius: app.theme.BUTTON_RADIUS
 
 <HeaderLayout>:
     canvas.after:
@@ -1531,7 +1967,13 @@ class RaspApTouchApp(App):
 
 <NavButton>:
     size_hint_y: 0.25
-    font_name: "FontAwesome"
+    canvas.after:
+        Color:
+            rgba: self.color
+        Rectangle:
+            texture: self.icon_texture
+            size: self.icon_texture.size if self.icon_texture else (0, 0)
+            pos: (int(self.center_x - self.icon_texture.width / 2), int(self.center_y - self.icon_texture.height / 2)) if self.icon_texture else self.pos
 
 <VpnButton>:
     canvas.before:
@@ -1542,8 +1984,10 @@ class RaspApTouchApp(App):
             size: self.size
 """
         Builder.load_string(kv_string)
+        prerender_icons()
 
-        sm = ScreenManager(transition=FadeTransition())
+        # Fade composites both screens through an FBO every frame; opt-in only
+        sm = ScreenManager(transition=FadeTransition() if CONFIG.get("transitions", False) else NoTransition())
         sm.add_widget(MainScreen(name='main'))
         sm.add_widget(WifiScreen(name='wifi'))
         sm.add_widget(VpnScreen(name='vpn'))
@@ -1552,16 +1996,30 @@ class RaspApTouchApp(App):
         sm.current = CONFIG.get("default_screen", "main")
         self.sm = sm
 
+        # One background for every screen, drawn behind the manager
+        with sm.canvas.before:
+            Color(*THEME.BACKGROUND_COLOR)
+            self._bg_rect = Rectangle(pos=sm.pos, size=sm.size)
+        sm.bind(pos=self._update_bg_rect, size=self._update_bg_rect)
+
         # Paint black on OS/WM close request as well
         Window.bind(on_request_close=self._before_close)
+        # No point polling while nothing is visible
+        Window.bind(on_hide=self._pause_pollers, on_minimize=self._pause_pollers,
+                    on_show=self._resume_pollers, on_restore=self._resume_pollers)
 
         # GeoIP triggers: debounce + periodic
         self._geoip_pending = None
+        self._geoip_due = 0.0
         self._geoip_periodic_ev = None
         self._bind_geoip_triggers()
 
         return sm
 
+    def _update_bg_rect(self, instance, value):
+        self._bg_rect.pos = instance.pos
+        self._bg_rect.size = instance.size
+
     def _bind_geoip_triggers(self):
         # Debounced trigger whenever net/VPN state changes
         def _trig(*args):
@@ -1574,12 +2032,16 @@ class RaspApTouchApp(App):
         )
 
     def _trigger_geoip_soon(self, delay=0.75):
-        # Debounce to avoid bursts
+        # Debounce to avoid bursts; a pending lookup with at least half the window left absorbs this one
+        pending = self._geoip_pending
+        if pending and pending.is_triggered and self._geoip_due - time.monotonic() >= delay / 2:
+            return
         try:
-            if self._geoip_pending:
-                self._geoip_pending.cancel()
+            if pending:
+                pending.cancel()
         except Exception:
             pass
+        self._geoip_due = time.monotonic() + delay
         self._geoip_pending = Clock.schedule_once(lambda dt: STATE.update_geoip_async(), delay)
 
     def _before_close(self, *args):
@@ -1591,20 +2053,54 @@ class RaspApTouchApp(App):
 
     def on_start(self):
         # Start normal polling
-        self.poller = StatePoller(CONFIG.get("update_interval", 2), STATE)
+        self.poller = StatePoller(UPDATE_INTERVAL, STATE)
         self.poller.start()
         STATE.update_async()
 
         # GeoIP: immediate, then periodic
         STATE.update_geoip_async()
+        self._start_geoip_periodic()
+
+    def _start_geoip_periodic(self):
+        if self._geoip_periodic_ev:
+            return
         self._geoip_periodic_ev = Clock.schedule_interval(
-            lambda dt: STATE.update_geoip_async(),
-            CONFIG.get("geoip_interval", 300)
+            self._geoip_tick,
+            GEOIP_INTERVAL
         )
 
+    def _geoip_tick(self, dt):
+        STATE.update_geoip_async(use_cache=True)
+
+    def _pause_pollers(self, *args):
+        poller = getattr(self, 'poller', None)
+        if poller:
+            poller.stop()
+        if self._geoip_periodic_ev:
+            self._geoip_periodic_ev.cancel()
+            self._geoip_periodic_ev = None
+        log.info("Window hidden; polling paused.")
+
+    def _resume_pollers(self, *args):
+        poller = getattr(self, 'poller', None)
+        if not poller or poller.running:
+            return  # not started yet, or already running
+        poller.start()
+        STATE.update_async()
+        self._start_geoip_periodic()
+        log.info("Window visible; polling resumed.")
+
     def on_stop(self):
+        # Let a running speed test stop at its next check
+        try:
+            self.sm.get_screen('info')._speedtest_cancel = True
+        except Exception:
+            pass
+
         # Cancel periodic/debounce timers
         try:
+            if getattr(self, 'poller', None):
+                self.poller.stop()
             if self._geoip_periodic_ev:
                 self._geoip_periodic_ev.cancel()
                 self._geoip_periodic_ev = None
@@ -1613,6 +2109,8 @@ class RaspApTouchApp(App):
                 self._geoip_pending = None
         except Exception:
             pass
+        # Nothing can submit now; drop queued pool work so exit does not wait on it
+        shutdown_workers()
 
         try:
             paint_black_now()